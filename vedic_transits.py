@@ -1,13 +1,29 @@
 import swisseph as swe
+import bisect
 import datetime
+import functools
+import hashlib
 import os
 import math
+import pickle
+import tempfile
+import threading
 
 # ==========================================
 # CONFIGURATION
 # ==========================================
 EPHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ephe')
 
+# Sidereal Mode: True Chitra Paksha (Lahiri)
+# SIDM_LAHIRI (1) is the standard constant for Chitra Paksha
+SID_MODE = swe.SIDM_LAHIRI
+
+# Computed event tables are kept here between runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'vedic_transits')
+
+# Bump whenever event computation changes, so old cache files are ignored
+CACHE_VERSION = 1
+
 # Planets to calculate
 # Format: (swisseph_id, "Name")
 PLANETS = [
@@ -22,6 +38,43 @@ PLANETS = [
     # Ketu is calculated relative to Rahu
 ]
 
+# Julian Days are rounded to this many decimals (~0.1 ms) before
+# being used as a cache key for planetary positions.
+JD_CACHE_DECIMALS = 9
+
+# Event times are refined to well under a second
+PRECISION_DAYS = 0.01 / 86400
+
+# Fastest daily motion (degrees/day) of each body, used to size scan steps
+PLANET_MAX_DEG_PER_DAY = {
+    swe.SUN: 1.02,
+    swe.MOON: 15.5,
+    swe.MARS: 0.8,
+    swe.MERCURY: 2.2,
+    swe.JUPITER: 0.25,
+    swe.VENUS: 1.27,
+    swe.SATURN: 0.13,
+    swe.MEAN_NODE: 0.06,
+    "KETU": 0.06,
+}
+
+# Largest arc a planet may cover between two scan samples.
+# Kept below a full sign (30 deg) so no ingress can be stepped over.
+SCAN_STEP_DEGREES = 25.0
+
+# Upper bound on the scan step, well below the shortest retrograde
+# period so at most one station falls between two samples
+MAX_SCAN_STEP_DAYS = 15.0
+
+# J2000.0 epoch, anchoring plain calendar arithmetic on Julian Days
+J2000_JD = 2451545.0
+J2000_DATETIME = datetime.datetime(2000, 1, 1, 12)
+
+MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+)
+
 ZODIAC_SIGNS = [
     "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", 
     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
@@ -36,55 +89,97 @@ def setup_swisseph():
     # Set path to ephemeris files
     swe.set_ephe_path(EPHE_PATH)
     
-    # Set Sidereal Mode to True Chitra Paksha (Lahiri)
-    # SIDM_LAHIRI (1) is the standard constant for Chitra Paksha
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    # Set Sidereal Mode (see SID_MODE)
+    swe.set_sid_mode(SID_MODE, 0, 0)
+
+def warm_up_swisseph():
+    """
+    Runs one throwaway calculation per ephemeris file (planets, Moon) so
+    the files are opened and read before the first real calculation.
+    """
+    jd = get_julian_day(datetime.datetime.now())
+    for planet_id in (swe.SUN, swe.MOON):
+        try:
+            swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        except swe.Error:
+            # Real calculations will report the problem
+            return
 
 def get_julian_day(dt):
     """Converts a python datetime to Julian Day (UT)."""
-    return swe.utc_to_jd(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second + dt.microsecond / 1e6, 1)[1]
+    # Inverse of get_datetime_from_jd: plain calendar arithmetic from J2000.0.
+    # UTC is taken as UT1; the difference (< 1 s) is below event precision.
+    return J2000_JD + (dt - J2000_DATETIME) / datetime.timedelta(days=1)
 
 def get_datetime_from_jd(jd):
     """Converts Julian Day (UT) back to python datetime."""
-    # result is (y, m, d, h, min, s)
-    res = swe.jdut1_to_utc(jd, 1)
-    y, m, d, h, mi, s = res
-    # Handle seconds carefully to avoid float rounding errors in display
-    micros = int((s - int(s)) * 1e6)
-    return datetime.datetime(int(y), int(m), int(d), int(h), int(mi), int(s), micros)
+    # Plain Gregorian calendar arithmetic from J2000.0, no swisseph call.
+    # UT1 is treated as UTC; the difference (< 1 s) is below display precision.
+    return J2000_DATETIME + datetime.timedelta(days=jd - J2000_JD)
 
 def get_planet_data(jd, planet_id):
     """
     Returns (longitude, speed, is_retrograde) for a given planet at a given JD.
     Uses Mean Nodes for Rahu/Ketu.
+    Positions are memoized on the JD rounded to ~0.1 ms.
     """
-    flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
+    jd = round(jd, JD_CACHE_DECIMALS)
     
     if planet_id == "KETU":
-        # Ketu is Rahu + 180 degrees
-        # Get Rahu data first
-        res = swe.calc_ut(jd, swe.MEAN_NODE, flags)
-        
-        # Unpack result: ((lon, lat, dist, speed_lon, ...), rflags)
-        rahu_data = res[0]
-        rahu_lon = rahu_data[0]
-        rahu_speed = rahu_data[3] # Speed is same magnitude usually
-        
-        ketu_lon = (rahu_lon + 180.0) % 360.0
+        # Ketu is Rahu + 180 degrees, from the same cached Mean Node position.
         # Rahu/Ketu Mean nodes are always retrograde mathematically (negative speed)
         # or rarely stationary. 
-        is_retro = rahu_speed < 0 
-        return ketu_lon, rahu_speed, is_retro
+        rahu_lon, speed = _calc_raw(jd, swe.MEAN_NODE)
+        lon = (rahu_lon + 180.0) % 360.0
     else:
-        res = swe.calc_ut(jd, planet_id, flags)
-        
-        # Unpack result: ((lon, lat, dist, speed_lon, ...), rflags)
-        data = res[0]
-        lon = data[0]
-        speed = data[3]
-        
-        is_retro = speed < 0
-        return lon, speed, is_retro
+        lon, speed = _calc_raw(jd, planet_id)
+    
+    return lon, speed, speed < 0
+
+@functools.lru_cache(maxsize=8192)
+def _calc_raw(jd, planet_id):
+    """Sidereal (longitude, speed) of a body at an already rounded JD."""
+    if planet_id == swe.MEAN_NODE:
+        # Closed-form mean node
+        trop_lon, trop_speed = mean_node_longitude(jd)
+    else:
+        # Tropical positions without nutation, i.e. measured from the same
+        # mean equinox as the ayanamsa subtracted below.
+        # Result is ((lon, lat, dist, speed_lon, ...), rflags)
+        pos, _ = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_NONUT)
+        trop_lon, trop_speed = pos[0], pos[3]
+    
+    # Shift into the sidereal zodiac
+    ayanamsa, ayanamsa_rate = get_ayanamsa(jd)
+    return (trop_lon - ayanamsa) % 360.0, trop_speed - ayanamsa_rate
+
+def get_ayanamsa(jd):
+    """
+    Returns (ayanamsa, degrees per day) at a JD, interpolated between
+    cached whole-day values. The mean ayanamsa drifts ~50"/year almost
+    linearly, so this is exact to far below an arcsecond.
+    """
+    day = math.floor(jd)
+    start = _ayanamsa_on_day(day)
+    rate = _ayanamsa_on_day(day + 1) - start
+    return start + rate * (jd - day), rate
+
+@functools.lru_cache(maxsize=4096)
+def _ayanamsa_on_day(day):
+    """Cached swisseph ayanamsa (current sidereal mode) at a whole JD."""
+    return swe.get_ayanamsa_ut(day)
+
+def mean_node_longitude(jd):
+    """
+    Tropical longitude and daily speed of the Moon's mean ascending node
+    (Rahu), from the polynomial in Meeus, Astronomical Algorithms (47.7).
+    Matches swisseph's MEAN_NODE to under 0.1 arcsecond.
+    """
+    # Julian centuries of Terrestrial Time since J2000.0
+    T = (jd + swe.deltat(jd) - J2000_JD) / 36525
+    lon = 125.0445479 - 1934.1362891 * T + 0.0020754 * T**2 + T**3 / 467441 - T**4 / 60616000
+    speed = (-1934.1362891 + 2 * 0.0020754 * T + 3 * T**2 / 467441 - 4 * T**3 / 60616000) / 36525
+    return lon % 360.0, speed
 
 def get_sign(lon):
     """Returns sign index (1-12) from longitude."""
@@ -96,93 +191,209 @@ def get_house(sign_num, asc_num):
     return h
 
 def format_date(dt):
-    """Formats datetime for display."""
-    return dt.strftime("%d-%b-%Y %H:%M")
+    """Formats datetime for display (DD-Mon-YYYY HH:MM)."""
+    # Same as strftime("%d-%b-%Y %H:%M"), without the locale lookup
+    return f"{dt.day:02d}-{MONTHS[dt.month-1]}-{dt.year} {dt.hour:02d}:{dt.minute:02d}"
+
+def _scan_step(planet_id):
+    """
+    Scan step (days) for a planet: as far as it can safely move (e.g. ~1.6
+    days for the Moon, 15 days for Saturn). Stations inside a step are
+    located by _refine_change, which also splits the step there before
+    looking for ingresses, so slow planets need no finer sampling.
+    """
+    return min(MAX_SCAN_STEP_DAYS, SCAN_STEP_DEGREES / PLANET_MAX_DEG_PER_DAY[planet_id])
+
+def scan_planets(planet_ids, start_jd, end_jd):
+    """
+    Samples several planets over the time range in a single sweep.
+    Every planet's step is a whole multiple of the finest one, so all grids
+    share instants and each instant is visited once for every planet due
+    there, letting swisseph reuse its per-instant work.
+    Returns {planet_id: (jds, longitudes, speeds)}, each grid closed by end_jd.
+    """
+    base_step = min(_scan_step(pid) for pid in planet_ids)
+    strides = [(pid, max(1, int(_scan_step(pid) / base_step))) for pid in planet_ids]
+    n_steps = int(math.ceil((end_jd - start_jd) / base_step))
+    
+    samples = {pid: ([], [], []) for pid in planet_ids}
+    for n in range(n_steps + 1):
+        jd = start_jd + n * base_step if n < n_steps else end_jd
+        for pid, stride in strides:
+            if n % stride == 0 or n == n_steps:
+                lon, speed, _ = get_planet_data(jd, pid)
+                jds, lons, speeds = samples[pid]
+                jds.append(jd)
+                lons.append(lon)
+                speeds.append(speed)
+    
+    return samples
+
+def _detect_changes(lons, speeds):
+    """
+    Classifies scan samples using inline arithmetic (no per-sample calls).
+    Returns (signs, retros, changes) where 'changes' holds every index i
+    whose (sign, retro) state differs from that of sample i+1.
+    """
+    signs = [int(lon / 30) + 1 for lon in lons]
+    retros = [speed < 0 for speed in speeds]
+    
+    # Pack each state into one int (sign in bits 0-3, retro in bit 5),
+    # so a single comparison per sample catches either kind of change
+    states = [sign | (retro << 5) for sign, retro in zip(signs, retros)]
+    changes = [i for i, (a, b) in enumerate(zip(states, states[1:])) if a != b]
+    return signs, retros, changes
+
+def _find_root(planet_id, value, low, low_data, high, high_data):
+    """
+    Narrows a bracket [low, high] around the zero crossing of
+    value(planet data), which has opposite signs at both ends, down to
+    PRECISION_DAYS. Uses regula falsi with the Illinois modification,
+    which converges in a handful of steps for the smooth curves we feed it.
+    Returns the final bracket as ((low, data), (high, data)).
+    """
+    f_low = value(low_data)
+    f_high = value(high_data)
+    
+    side = 0
+    for _ in range(50):
+        if high - low <= PRECISION_DAYS:
+            break
+        
+        mid = high - f_high * (high - low) / (f_high - f_low)
+        # Stay at least half a tolerance inside so the bracket keeps shrinking
+        mid = min(max(mid, low + PRECISION_DAYS / 2), high - PRECISION_DAYS / 2)
+        mid_data = get_planet_data(mid, planet_id)
+        f_mid = value(mid_data)
+        
+        if (f_mid < 0) == (f_low < 0):
+            low, low_data, f_low = mid, mid_data, f_mid
+            if side == -1:
+                f_high /= 2
+            side = -1
+        else:
+            high, high_data, f_high = mid, mid_data, f_mid
+            if side == 1:
+                f_low /= 2
+            side = 1
+    
+    return (low, low_data), (high, high_data)
+
+def _sign_boundary(sign_a, sign_b):
+    """Longitude of the cusp between two adjacent signs, else None."""
+    if sign_b == sign_a % 12 + 1:
+        return sign_a * 30.0
+    if sign_a == sign_b % 12 + 1:
+        return sign_b * 30.0
+    return None
+
+def _refine_change(planet_id, low, low_data, high, high_data):
+    """
+    Finds the first moment in (low, high] the planet leaves the
+    (sign, retro) state it had at 'low'. Precision is PRECISION_DAYS.
+    low_data/high_data are the (longitude, speed, is_retrograde) samples
+    already known at both ends.
+    Stations are root-found on speed, sign ingresses on the distance
+    to the cusp; anything else falls back to a binary search.
+    Returns (jd, (longitude, speed, is_retrograde)) at that moment.
+    """
+    prev_sign = get_sign(low_data[0])
+    h_sign = get_sign(high_data[0])
+    
+    if high_data[2] != low_data[2]:
+        # Speed crosses zero smoothly at the station
+        (st_low, st_low_data), station = _find_root(
+            planet_id, lambda data: data[1], low, low_data, high, high_data
+        )
+        st_sign = get_sign(st_low_data[0])
+        if st_sign == prev_sign:
+            return station
+        # The sign changed first, while motion was still monotone
+        high, high_data = st_low, st_low_data
+        h_sign = st_sign
+    
+    boundary = _sign_boundary(prev_sign, h_sign)
+    if boundary is None:
+        return _bisect_change(planet_id, low, low_data, high, high_data)
+    
+    # Signed distance from the cusp, safe across the 360 -> 0 wrap
+    def cusp_offset(data):
+        return (data[0] - boundary + 180.0) % 360.0 - 180.0
+    
+    return _find_root(planet_id, cusp_offset, low, low_data, high, high_data)[1]
+
+def _bisect_change(planet_id, low, low_data, high, high_data):
+    """
+    Binary-searches (low, high] for the first moment the planet leaves the
+    (sign, retro) state it had at 'low'. Precision is PRECISION_DAYS.
+    Returns (jd, (longitude, speed, is_retrograde)) at that moment.
+    """
+    prev_sign = get_sign(low_data[0])
+    prev_retro = low_data[2]
+    found_jd, found_data = high, high_data
+    
+    # Precision loop, halving until the bracket is within PRECISION_DAYS
+    # whatever the scan step (a fixed count would leave 15-day steps at ~1 s)
+    while high - low > PRECISION_DAYS:
+        mid = (low + high) / 2
+        m_data = get_planet_data(mid, planet_id)
+        m_lon, m_speed, m_retro = m_data
+        
+        # Logic: Did the change happen in the first half?
+        # If 'mid' still matches the 'prev' state, change is in upper half.
+        # If not, change is in lower half.
+        if get_sign(m_lon) == prev_sign and m_retro == prev_retro:
+            low = mid
+        else:
+            high = mid
+            # This is a candidate for the change time
+            found_jd, found_data = mid, m_data
+    
+    return found_jd, found_data
 
 def find_events(planet_id, start_jd, end_jd):
     """
     Scans the time range to find 'events' (Sign Changes or Motion Changes).
     Returns a list of dictionaries containing state data at specific times.
     """
+    jds, lons, speeds = scan_planets([planet_id], start_jd, end_jd)[planet_id]
+    return find_events_from_scan(planet_id, jds, lons, speeds)
+
+def find_events_from_scan(planet_id, jds, lons, speeds):
+    """
+    Same as find_events, starting from samples produced by scan_planets.
+    """
     events = []
-    
-    # Initial State
-    current_jd = start_jd
-    curr_lon, curr_speed, curr_retro = get_planet_data(current_jd, planet_id)
-    curr_sign = get_sign(curr_lon)
+    signs, retros, changes = _detect_changes(lons, speeds)
     
     # Add start point
     events.append({
-        'jd': current_jd,
-        'sign': curr_sign,
-        'retro': curr_retro,
-        'speed': curr_speed
+        'jd': jds[0],
+        'sign': signs[0],
+        'retro': retros[0],
+        'speed': speeds[0]
     })
     
-    # Scan parameters
-    # For fast planets (Moon), we need smaller steps. 
-    # For others, 6 hours is usually safe to detect sign entry, 
-    # but we will use binary search refinement.
-    step_days = 0.25 # 6 hours
-    if planet_id == swe.MOON:
-        step_days = 0.04 # ~1 hour
+    for i in changes:
+        # Bracket the change with the scan samples themselves
+        prev_jd = jds[i]
+        prev_data = (lons[i], speeds[i], retros[i])
+        prev_sign = signs[i]
+        prev_retro = retros[i]
+        next_jd = jds[i+1]
+        next_data = (lons[i+1], speeds[i+1], retros[i+1])
         
-    scan_jd = start_jd
-    
-    while scan_jd < end_jd:
-        prev_jd = scan_jd
-        prev_lon = curr_lon
-        prev_retro = curr_retro
-        prev_sign = curr_sign
-        
-        scan_jd += step_days
-        if scan_jd > end_jd:
-            scan_jd = end_jd
-            
-        curr_lon, curr_speed, curr_retro = get_planet_data(scan_jd, planet_id)
-        curr_sign = get_sign(curr_lon)
-        
-        # Check for State Change
-        sign_changed = curr_sign != prev_sign
-        motion_changed = curr_retro != prev_retro
-        
-        if sign_changed or motion_changed:
-            # REFINE TIME using Binary Search
-            # We want to find the exact moment the state changed between prev_jd and scan_jd
-            
-            low = prev_jd
-            high = scan_jd
-            found_jd = high
-            
-            # Precision loop (down to ~1 second)
-            for _ in range(20):
-                mid = (low + high) / 2
-                m_lon, m_speed, m_retro = get_planet_data(mid, planet_id)
-                m_sign = get_sign(m_lon)
-                
-                # Logic: Did the change happen in the first half?
-                # We check if the state at 'mid' matches the 'prev' state.
-                # If matches, change is in upper half. If not, change is in lower half.
-                
-                # Check what type of change we are looking for.
-                # If both happened, we prioritize the earlier one implicitly by narrowing down.
-                # But usually, they don't happen exact same second.
-                
-                match_prev = (m_sign == prev_sign) if sign_changed else True
-                if motion_changed:
-                    match_prev = match_prev and (m_retro == prev_retro)
-                
-                if match_prev:
-                    low = mid
-                else:
-                    high = mid
-                    found_jd = mid # This is a candidate for the change time
-            
-            # Register the event
-            # Get precise properties at the found time
-            f_lon, f_speed, f_retro = get_planet_data(found_jd, planet_id)
+        # Refine every change inside the interval, earliest first,
+        # in case a sign and motion change fall within the same step
+        while prev_sign != signs[i+1] or prev_retro != retros[i+1]:
+            # Precise properties come back with the found time
+            found_jd, found_data = _refine_change(
+                planet_id, prev_jd, prev_data, next_jd, next_data
+            )
+            f_lon, f_speed, f_retro = found_data
             f_sign = get_sign(f_lon)
             
+            # Register the event
             events.append({
                 'jd': found_jd,
                 'sign': f_sign,
@@ -190,22 +401,103 @@ def find_events(planet_id, start_jd, end_jd):
                 'speed': f_speed
             })
             
-            # Reset loop vars to the event found to ensure we don't skip a double event 
-            # (though unlikely in 6 hrs)
-            scan_jd = found_jd 
-            curr_lon, curr_speed, curr_retro = f_lon, f_speed, f_retro
-            curr_sign = f_sign
-            
-            # Add a tiny epsilon to scan_jd so we don't find the same event again
-            scan_jd += 0.0001 
-
-    # Add end point closure if not exactly on end
-    if events[-1]['jd'] < end_jd:
-         # Just to close the loop
-         pass
-         
+            prev_jd = found_jd
+            prev_data = found_data
+            prev_sign = f_sign
+            prev_retro = f_retro
+    
     return events
 
+def derive_ketu_events(rahu_events):
+    """
+    Ketu is always exactly opposite Rahu, so it changes sign and motion
+    at the same moments, six signs away. Returns Ketu's events.
+    """
+    return [
+        dict(e, sign=((e['sign'] - 1 + 6) % 12) + 1)
+        for e in rahu_events
+    ]
+
+def clip_events(events, start_jd, end_jd):
+    """
+    Restricts events computed over a wider range to [start_jd, end_jd].
+    The state in force at start_jd becomes the first event.
+    """
+    first = max(0, bisect.bisect_right([e['jd'] for e in events], start_jd) - 1)
+    clipped = [dict(events[first], jd=start_jd)]
+    clipped.extend(e for e in events[first+1:] if e['jd'] <= end_jd)
+    return clipped
+
+# ==========================================
+# EVENT CACHE
+# ==========================================
+
+def get_cache_path(start_date, end_date):
+    """
+    Cache file for the events between two dates. The name also encodes the
+    cache version, sidereal mode and ephemeris path, so changing any of
+    them starts a fresh cache.
+    """
+    ephe_key = hashlib.md5(EPHE_PATH.encode('utf-8')).hexdigest()[:8]
+    name = f"events_v{CACHE_VERSION}_{start_date}_{end_date}_sid{SID_MODE}_{ephe_key}.pkl"
+    return os.path.join(CACHE_DIR, name)
+
+def load_cached_events(path):
+    """
+    Returns the cached {planet_id: events} at path, or None if the file is
+    missing, unreadable or doesn't hold events for every planet in PLANETS.
+    """
+    try:
+        with open(path, 'rb') as f:
+            events_by_planet = pickle.load(f)
+    except Exception:
+        # pickle.load can raise almost anything on corrupt data
+        return None
+    
+    if not isinstance(events_by_planet, dict):
+        return None
+    for pid, _ in PLANETS:
+        events = events_by_planet.get(pid)
+        if not isinstance(events, list) or not events:
+            return None
+    return events_by_planet
+
+def save_cached_events(path, events_by_planet):
+    """
+    Writes {planet_id: events} to path and removes the other cached event
+    files, which belong to earlier days. Failures are ignored (cache is optional).
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a uniquely named temporary file first, so readers never
+        # see a partial file and concurrent runs don't share one
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(events_by_planet, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    
+    # Only the current timeframe is ever read back
+    cache_dir, current = os.path.split(path)
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith('events_') and name.endswith('.pkl') and name != current:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
 # ==========================================
 # MAIN SCRIPT
 # ==========================================
@@ -230,6 +522,10 @@ def main():
         input("Press Enter to exit...")
         return
 
+    # Load the ephemeris files in the background while the user types
+    warm_up = threading.Thread(target=warm_up_swisseph, daemon=True)
+    warm_up.start()
+
     # User Input
     while True:
         try:
@@ -241,7 +537,13 @@ def main():
         except ValueError:
             print("Please enter a valid integer.")
 
+    # swisseph is not thread-safe, so let the warm-up finish first
+    warm_up.join()
+
     print(f"\nCalculations based on Ascendant: {ZODIAC_SIGNS[asc_num-1]} ({asc_num})")
+
+    # Whole Sign House of each sign for this Ascendant, indexed by sign-1
+    house_of = tuple(get_house(sign_num, asc_num) for sign_num in range(1, 13))
     print("Generating tables... Please wait.\n")
 
     # Timeframe definition
@@ -257,11 +559,38 @@ def main():
     all_planets = PLANETS.copy()
     all_planets.append(("KETU", "Ketu")) # Add Ketu manually to list
 
-    for pid, pname in all_planets:
-        print(f"Processing {pname}...")
+    # Events don't depend on the Ascendant, so they are computed over the
+    # whole days spanning the timeframe and cached on disk for later runs
+    range_start = datetime.datetime.combine(start_dt.date(), datetime.time())
+    range_end = datetime.datetime.combine(end_dt.date(), datetime.time()) + datetime.timedelta(days=1)
+    cache_path = get_cache_path(range_start.date(), range_end.date())
+    
+    range_events = load_cached_events(cache_path)
+    if range_events is None:
+        # Sample every scanned planet in one pass over the time range
+        scans = scan_planets(
+            [pid for pid, _ in PLANETS], get_julian_day(range_start), get_julian_day(range_end)
+        )
         
-        # Calculate events (Sign changes and Motion changes)
-        events = find_events(pid, start_jd, end_jd)
+        range_events = {}
+        for pid, pname in PLANETS:
+            print(f"Processing {pname}...")
+            # Calculate events (Sign changes and Motion changes)
+            range_events[pid] = find_events_from_scan(pid, *scans[pid])
+        save_cached_events(cache_path, range_events)
+    else:
+        print(f"Using cached events: {cache_path}")
+
+    # Events per planet, reused by the snapshot below
+    events_by_planet = {}
+
+    for pid, pname in all_planets:
+        if pid == "KETU":
+            # Mirror Rahu's events rather than scanning the node again
+            events = derive_ketu_events(events_by_planet[swe.MEAN_NODE])
+        else:
+            events = clip_events(range_events[pid], start_jd, end_jd)
+        events_by_planet[pid] = events
         
         # Display Table Header
         print(f"\nTABLE: {pname.upper()}")
@@ -281,7 +610,7 @@ def main():
             # State
             sign_idx = current_event['sign']
             sign_name = ZODIAC_SIGNS[sign_idx-1]
-            house_num = get_house(sign_idx, asc_num)
+            house_num = house_of[sign_idx-1]
             is_retro = current_event['retro']
             motion_str = "Retrograde" if is_retro else "Direct"
             
@@ -330,7 +659,7 @@ def main():
         curr_lon, curr_speed, curr_retro = get_planet_data(now_jd, pid)
         sign_idx = get_sign(curr_lon)
         sign_name = ZODIAC_SIGNS[sign_idx-1]
-        house_num = get_house(sign_idx, asc_num)
+        house_num = house_of[sign_idx-1]
         
         # Calculate degrees within sign for display
         deg_in_sign = curr_lon % 30
@@ -339,21 +668,24 @@ def main():
         motion_str = "Retro" if curr_retro else "Direct"
         
         # Find Duration (Start and End of current state)
-        # We need to scan events again for this specific planet to find where 'now' fits
-        events = find_events(pid, start_jd, end_jd)
+        # Reuse the events computed for the tables to find where 'now' fits
+        events = events_by_planet[pid]
         
         start_str = "Unknown"
         end_str = "Unknown"
         
-        for i in range(len(events)):
-            t_s = events[i]['jd']
+        # Last event starting at or before 'now'
+        event_jds = [e['jd'] for e in events]
+        i = bisect.bisect_right(event_jds, now_jd) - 1
+        
+        if i >= 0:
+            t_s = event_jds[i]
             # If it's the last event, it goes to end_jd
-            t_e = events[i+1]['jd'] if i < len(events) - 1 else end_jd
+            t_e = event_jds[i+1] if i < len(event_jds) - 1 else end_jd
             
-            if t_s <= now_jd <= t_e:
+            if now_jd <= t_e:
                 start_str = format_date(get_datetime_from_jd(t_s))
                 end_str = format_date(get_datetime_from_jd(t_e))
-                break
         
         print(f"{pname:<8} | {sign_name:<10} | {house_num:<3} | {motion_str:<8} | {d_str:<16} | {start_str:<18} | {end_str:<18}")
 